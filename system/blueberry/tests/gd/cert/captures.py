@@ -29,36 +29,68 @@ class HalCaptures(object):
 
     @staticmethod
     def ReadBdAddrCompleteCapture():
-        return Capture(
-            lambda packet: packet.payload[0:5] == b'\x0e\x0a\x01\x09\x10', lambda packet: hci_packets.ReadBdAddrCompleteView(
-                hci_packets.CommandCompleteView(
-                    hci_packets.EventView(bt_packets.PacketViewLittleEndian(list(packet.payload))))))
+        return Capture(HalCaptures._is_read_bd_addr_complete, HalCaptures._extract_read_bd_addr_complete)
+
+    @staticmethod
+    def _is_read_bd_addr_complete(packet):
+        return packet.payload.startswith(b'\x0e\x0a\x01\x09\x10')
+
+    @staticmethod
+    def _extract_read_bd_addr_complete(packet):
+        return hci_packets.ReadBdAddrCompleteView(
+            hci_packets.CommandCompleteView(HalCaptures._event_view(packet)))
 
     @staticmethod
     def ConnectionRequestCapture():
-        return Capture(
-            lambda packet: packet.payload[0:2] == b'\x04\x0a', lambda packet: hci_packets.ConnectionRequestView(
-                hci_packets.EventView(bt_packets.PacketViewLittleEndian(list(packet.payload)))))
+        return Capture(HalCaptures._is_connection_request, HalCaptures._extract_connection_request)
+
+    @staticmethod
+    def _is_connection_request(packet):
+        return packet.payload.startswith(b'\x04\x0a')
+
+    @staticmethod
+    def _extract_connection_request(packet):
+        return hci_packets.ConnectionRequestView(HalCaptures._event_view(packet))
 
     @staticmethod
     def ConnectionCompleteCapture():
-        return Capture(
-            lambda packet: packet.payload[0:3] == b'\x03\x0b\x00', lambda packet: hci_packets.ConnectionCompleteView(
-                hci_packets.EventView(bt_packets.PacketViewLittleEndian(list(packet.payload)))))
+        return Capture(HalCaptures._is_connection_complete, HalCaptures._extract_connection_complete)
+
+    @staticmethod
+    def _is_connection_complete(packet):
+        return packet.payload.startswith(b'\x03\x0b\x00')
+
+    @staticmethod
+    def _extract_connection_complete(packet):
+        return hci_packets.ConnectionCompleteView(HalCaptures._event_view(packet))
 
     @staticmethod
     def DisconnectionCompleteCapture():
-        return Capture(
-            lambda packet: packet.payload[0:2] == b'\x05\x04', lambda packet: hci_packets.DisconnectionCompleteView(
-                hci_packets.EventView(bt_packets.PacketViewLittleEndian(list(packet.payload)))))
+        return Capture(HalCaptures._is_disconnection_complete, HalCaptures._extract_disconnection_complete)
+
+    @staticmethod
+    def _is_disconnection_complete(packet):
+        return packet.payload.startswith(b'\x05\x04')
+
+    @staticmethod
+    def _extract_disconnection_complete(packet):
+        return hci_packets.DisconnectionCompleteView(HalCaptures._event_view(packet))
 
     @staticmethod
     def LeConnectionCompleteCapture():
-        return Capture(
-            lambda packet: packet.payload[0] == 0x3e and (packet.payload[2] == 0x01 or packet.payload[2] == 0x0a),
-            lambda packet: hci_packets.LeConnectionCompleteView(
-                hci_packets.LeMetaEventView(
-                    hci_packets.EventView(bt_packets.PacketViewLittleEndian(list(packet.payload))))))
+        return Capture(HalCaptures._is_le_connection_complete, HalCaptures._extract_le_connection_complete)
+
+    @staticmethod
+    def _is_le_connection_complete(packet):
+        return packet.payload.startswith(b'\x3e') and packet.payload[2] in (0x01, 0x0a)
+
+    @staticmethod
+    def _extract_le_connection_complete(packet):
+        return hci_packets.LeConnectionCompleteView(hci_packets.LeMetaEventView(HalCaptures._event_view(packet)))
+
+    @staticmethod
+    def _event_view(packet):
+        return hci_packets.EventView(bt_packets.PacketViewLittleEndian(list(packet.payload)))
 
 
 class HciCaptures(object):
@@ -67,53 +99,84 @@ class HciCaptures(object):
     def ReadLocalOobDataCompleteCapture():
         return Capture(
             HciMatchers.CommandComplete(hci_packets.OpCode.READ_LOCAL_OOB_DATA),
-            lambda packet: HciMatchers.ExtractMatchingCommandComplete(packet.payload, hci_packets.OpCode.READ_LOCAL_OOB_DATA)
-        )
+            HciCaptures._extract_read_local_oob_data_complete)
+
+    @staticmethod
+    def _extract_read_local_oob_data_complete(packet):
+        return HciMatchers.ExtractMatchingCommandComplete(packet.payload, hci_packets.OpCode.READ_LOCAL_OOB_DATA)
 
     @staticmethod
     def ReadLocalOobExtendedDataCompleteCapture():
         return Capture(
             HciMatchers.CommandComplete(hci_packets.OpCode.READ_LOCAL_OOB_EXTENDED_DATA),
-            lambda packet: HciMatchers.ExtractMatchingCommandComplete(packet.payload, hci_packets.OpCode.READ_LOCAL_OOB_EXTENDED_DATA)
-        )
+            HciCaptures._extract_read_local_oob_extended_data_complete)
+
+    @staticmethod
+    def _extract_read_local_oob_extended_data_complete(packet):
+        return HciMatchers.ExtractMatchingCommandComplete(packet.payload,
+                                                          hci_packets.OpCode.READ_LOCAL_OOB_EXTENDED_DATA)
 
     @staticmethod
     def ReadBdAddrCompleteCapture():
         return Capture(
-            HciMatchers.CommandComplete(hci_packets.OpCode.READ_BD_ADDR),
-            lambda packet: hci_packets.ReadBdAddrCompleteView(HciMatchers.ExtractMatchingCommandComplete(packet.payload, hci_packets.OpCode.READ_BD_ADDR)))
+            HciMatchers.CommandComplete(hci_packets.OpCode.READ_BD_ADDR), HciCaptures._extract_read_bd_addr_complete)
+
+    @staticmethod
+    def _extract_read_bd_addr_complete(packet):
+        return hci_packets.ReadBdAddrCompleteView(
+            HciMatchers.ExtractMatchingCommandComplete(packet.payload, hci_packets.OpCode.READ_BD_ADDR))
 
     @staticmethod
     def ConnectionRequestCapture():
         return Capture(
             HciMatchers.EventWithCode(hci_packets.EventCode.CONNECTION_REQUEST),
-            lambda packet: hci_packets.ConnectionRequestView(
-                HciMatchers.ExtractEventWithCode(packet.payload, hci_packets.EventCode.CONNECTION_REQUEST)))
+            HciCaptures._extract_connection_request)
+
+    @staticmethod
+    def _extract_connection_request(packet):
+        return hci_packets.ConnectionRequestView(
+            HciMatchers.ExtractEventWithCode(packet.payload, hci_packets.EventCode.CONNECTION_REQUEST))
 
     @staticmethod
     def ConnectionCompleteCapture():
         return Capture(
             HciMatchers.EventWithCode(hci_packets.EventCode.CONNECTION_COMPLETE),
-            lambda packet: hci_packets.ConnectionCompleteView(
-                HciMatchers.ExtractEventWithCode(packet.payload, hci_packets.EventCode.CONNECTION_COMPLETE)))
+            HciCaptures._extract_connection_complete)
+
+    @staticmethod
+    def _extract_connection_complete(packet):
+        return hci_packets.ConnectionCompleteView(
+            HciMatchers.ExtractEventWithCode(packet.payload, hci_packets.EventCode.CONNECTION_COMPLETE))
 
     @staticmethod
     def DisconnectionCompleteCapture():
         return Capture(
             HciMatchers.EventWithCode(hci_packets.EventCode.DISCONNECTION_COMPLETE),
-            lambda packet: hci_packets.DisconnectionCompleteView(
-                HciMatchers.ExtractEventWithCode(packet.payload, hci_packets.EventCode.DISCONNECTION_COMPLETE)))
+            HciCaptures._extract_disconnection_complete)
+
+    @staticmethod
+    def _extract_disconnection_complete(packet):
+        return hci_packets.DisconnectionCompleteView(
+            HciMatchers.ExtractEventWithCode(packet.payload, hci_packets.EventCode.DISCONNECTION_COMPLETE))
 
     @staticmethod
     def LeConnectionCompleteCapture():
-        return Capture(HciMatchers.LeConnectionComplete(),
-                       lambda packet: HciMatchers.ExtractLeConnectionComplete(packet.payload))
+        return Capture(HciMatchers.LeConnectionComplete(), HciCaptures._extract_le_connection_complete)
+
+    @staticmethod
+    def _extract_le_connection_complete(packet):
+        return HciMatchers.ExtractLeConnectionComplete(packet.payload)
 
     @staticmethod
     def SimplePairingCompleteCapture():
-        return Capture(HciMatchers.EventWithCode(hci_packets.EventCode.SIMPLE_PAIRING_COMPLETE),
-            lambda packet: hci_packets.SimplePairingCompleteView(
-                HciMatchers.ExtractEventWithCode(packet.payload, hci_packets.EventCode.SIMPLE_PAIRING_COMPLETE)))
+        return Capture(
+            HciMatchers.EventWithCode(hci_packets.EventCode.SIMPLE_PAIRING_COMPLETE),
+            HciCaptures._extract_simple_pairing_complete)
+
+    @staticmethod
+    def _extract_simple_pairing_complete(packet):
+        return hci_packets.SimplePairingCompleteView(
+            HciMatchers.ExtractEventWithCode(packet.payload, hci_packets.EventCode.SIMPLE_PAIRING_COMPLETE))
 
 
 class L2capCaptures(object):
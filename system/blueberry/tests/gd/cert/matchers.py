@@ -15,6 +15,7 @@
 #   limitations under the License.
 
 import bluetooth_packets_python3 as bt_packets
+import functools
 import logging
 
 from bluetooth_packets_python3 import hci_packets
@@ -27,123 +28,149 @@ from bluetooth_packets_python3.l2cap_packets import InformationRequestInfoType
 from bluetooth_packets_python3.l2cap_packets import LeCreditBasedConnectionResponseResult
 
 
-class HciMatchers(object):
+# Raw values of the codes the helpers below peek at, so the hot path compares plain ints.
+_COMMAND_COMPLETE = int(EventCode.COMMAND_COMPLETE)
+_COMMAND_STATUS = int(EventCode.COMMAND_STATUS)
+_LE_META_EVENT = int(EventCode.LE_META_EVENT)
+_CONNECTION_COMPLETE = int(hci_packets.SubeventCode.CONNECTION_COMPLETE)
+_ENHANCED_CONNECTION_COMPLETE = int(hci_packets.SubeventCode.ENHANCED_CONNECTION_COMPLETE)
+_LE_CONNECTION_COMPLETE_SUBEVENTS = frozenset((_CONNECTION_COMPLETE, _ENHANCED_CONNECTION_COMPLETE))
 
-    @staticmethod
-    def CommandComplete(opcode):
-        return lambda msg: HciMatchers._is_matching_command_complete(msg.payload, opcode)
 
-    @staticmethod
-    def ExtractMatchingCommandComplete(packet_bytes, opcode=None):
-        return HciMatchers._extract_matching_command_complete(packet_bytes, opcode)
+@functools.lru_cache(maxsize=32)
+def _parse_event(packet_bytes):
+    # Every matcher waiting on a stream sees the same packets; parse each one once.
+    return hci_packets.EventView(bt_packets.PacketViewLittleEndian(list(packet_bytes)))
 
-    @staticmethod
-    def _is_matching_command_complete(packet_bytes, opcode=None):
-        return HciMatchers._extract_matching_command_complete(packet_bytes, opcode) is not None
 
-    @staticmethod
-    def _extract_matching_command_complete(packet_bytes, opcode=None):
-        event = HciMatchers._extract_matching_event(packet_bytes, EventCode.COMMAND_COMPLETE)
-        if event is None:
+def _extract_matching_event(packet_bytes, event_code):
+    # |event_code| is a raw int (or None for any event). It is the first byte of the packet, so check it before
+    # paying for a full parse.
+    if event_code is not None and (len(packet_bytes) == 0 or packet_bytes[0] != event_code):
+        return None
+    return _parse_event(bytes(packet_bytes))
+
+
+def _is_matching_event(packet_bytes, event_code):
+    return _extract_matching_event(packet_bytes, event_code) is not None
+
+
+def _extract_matching_command_complete(packet_bytes, opcode=None):
+    event = _extract_matching_event(packet_bytes, _COMMAND_COMPLETE)
+    if event is None:
+        return None
+    complete = hci_packets.CommandCompleteView(event)
+    if opcode is None or complete is None:
+        return complete
+    else:
+        if complete.GetCommandOpCode() != opcode:
             return None
-        complete = hci_packets.CommandCompleteView(event)
-        if opcode is None or complete is None:
+        else:
             return complete
+
+
+def _is_matching_command_complete(packet_bytes, opcode=None):
+    return _extract_matching_command_complete(packet_bytes, opcode) is not None
+
+
+def _extract_matching_command_status(packet_bytes, opcode=None):
+    event = _extract_matching_event(packet_bytes, _COMMAND_STATUS)
+    if event is None:
+        return None
+    complete = hci_packets.CommandStatusView(event)
+    if opcode is None or complete is None:
+        return complete
+    else:
+        if complete.GetCommandOpCode() != opcode:
+            return None
         else:
-            if complete.GetCommandOpCode() != opcode:
-                return None
-            else:
-                return complete
+            return complete
 
-    @staticmethod
-    def CommandStatus(opcode=None):
-        return lambda msg: HciMatchers._is_matching_command_status(msg.payload, opcode)
 
-    @staticmethod
-    def ExtractMatchingCommandStatus(packet_bytes, opcode=None):
-        return HciMatchers._extract_matching_command_complete(packet_bytes, opcode)
+def _is_matching_command_status(packet_bytes, opcode=None):
+    return _extract_matching_command_status(packet_bytes, opcode) is not None
+
+
+def _extract_matching_le_event(packet_bytes, subevent_code):
+    # |subevent_code| is a raw int, or None which never matches. LE Meta events carry it right after the parameter
+    # length.
+    if subevent_code is None or len(packet_bytes) < 3 or packet_bytes[2] != subevent_code:
+        return None
+    inner_event = _extract_matching_event(packet_bytes, _LE_META_EVENT)
+    if inner_event is None:
+        return None
+    return hci_packets.LeMetaEventView(inner_event)
+
+
+def _extract_le_connection_complete(packet_bytes):
+    if len(packet_bytes) < 3 or packet_bytes[2] not in _LE_CONNECTION_COMPLETE_SUBEVENTS:
+        return None
+    subevent_code = packet_bytes[2]
+    inner_event = _extract_matching_le_event(packet_bytes, subevent_code)
+    if inner_event is None:
+        return None
+    if subevent_code == _CONNECTION_COMPLETE:
+        return hci_packets.LeConnectionCompleteView(inner_event)
+    return hci_packets.LeEnhancedConnectionCompleteView(inner_event)
+
+
+def _log_event_code(event):
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info("Received event: %x", _parse_event(bytes(event.payload)).GetEventCode())
+
+
+class HciMatchers(object):
 
     @staticmethod
-    def _is_matching_command_status(packet_bytes, opcode=None):
-        return HciMatchers._extract_matching_command_status(packet_bytes, opcode) is not None
+    @functools.lru_cache(maxsize=256)
+    def CommandComplete(opcode):
+        return lambda msg, _opcode=opcode: _is_matching_command_complete(msg.payload, _opcode)
 
     @staticmethod
-    def _extract_matching_command_status(packet_bytes, opcode=None):
-        event = HciMatchers._extract_matching_event(packet_bytes, EventCode.COMMAND_STATUS)
-        if event is None:
-            return None
-        complete = hci_packets.CommandStatusView(event)
-        if opcode is None or complete is None:
-            return complete
-        else:
-            if complete.GetCommandOpCode() != opcode:
-                return None
-            else:
-                return complete
+    def ExtractMatchingCommandComplete(packet_bytes, opcode=None):
+        return _extract_matching_command_complete(packet_bytes, opcode)
 
     @staticmethod
-    def EventWithCode(event_code):
-        return lambda msg: HciMatchers._is_matching_event(msg.payload, event_code)
+    @functools.lru_cache(maxsize=256)
+    def CommandStatus(opcode=None):
+        return lambda msg, _opcode=opcode: _is_matching_command_status(msg.payload, _opcode)
 
     @staticmethod
-    def ExtractEventWithCode(packet_bytes, event_code):
-        return HciMatchers._extract_matching_event(packet_bytes, event_code)
+    def ExtractMatchingCommandStatus(packet_bytes, opcode=None):
+        return _extract_matching_command_complete(packet_bytes, opcode)
 
     @staticmethod
-    def _is_matching_event(packet_bytes, event_code):
-        return HciMatchers._extract_matching_event(packet_bytes, event_code) is not None
+    @functools.lru_cache(maxsize=256)
+    def EventWithCode(event_code):
+        code = None if event_code is None else int(event_code)
+        return lambda msg, _code=code: _is_matching_event(msg.payload, _code)
 
     @staticmethod
-    def _extract_matching_event(packet_bytes, event_code):
-        event = hci_packets.EventView(bt_packets.PacketViewLittleEndian(list(packet_bytes)))
-        if event is None:
-            return None
-        if event_code is not None and event.GetEventCode() != event_code:
-            return None
-        return event
+    def ExtractEventWithCode(packet_bytes, event_code):
+        return _extract_matching_event(packet_bytes, None if event_code is None else int(event_code))
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def LeEventWithCode(subevent_code):
-        return lambda msg: HciMatchers._extract_matching_le_event(msg.payload, subevent_code) is not None
+        code = None if subevent_code is None else int(subevent_code)
+        return lambda msg, _code=code: _extract_matching_le_event(msg.payload, _code) is not None
 
     @staticmethod
     def ExtractLeEventWithCode(packet_bytes, subevent_code):
-        return HciMatchers._extract_matching_le_event(packet_bytes, subevent_code)
-
-    @staticmethod
-    def _extract_matching_le_event(packet_bytes, subevent_code):
-        inner_event = HciMatchers._extract_matching_event(packet_bytes, hci_packets.EventCode.LE_META_EVENT)
-        if inner_event is None:
-            return None
-        event = hci_packets.LeMetaEventView(inner_event)
-        if event.GetSubeventCode() != subevent_code:
-            return None
-        return event
+        return _extract_matching_le_event(packet_bytes, None if subevent_code is None else int(subevent_code))
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def LeConnectionComplete():
-        return lambda msg: HciMatchers._extract_le_connection_complete(msg.payload) is not None
+        return lambda msg: _extract_le_connection_complete(msg.payload) is not None
 
     @staticmethod
     def ExtractLeConnectionComplete(packet_bytes):
-        return HciMatchers._extract_le_connection_complete(packet_bytes)
-
-    @staticmethod
-    def _extract_le_connection_complete(packet_bytes):
-        inner_event = HciMatchers._extract_matching_le_event(packet_bytes, hci_packets.SubeventCode.CONNECTION_COMPLETE)
-        if inner_event is not None:
-            return hci_packets.LeConnectionCompleteView(inner_event)
-
-        inner_event = HciMatchers._extract_matching_le_event(packet_bytes,
-                                                             hci_packets.SubeventCode.ENHANCED_CONNECTION_COMPLETE)
-        if inner_event is not None:
-            return hci_packets.LeEnhancedConnectionCompleteView(inner_event)
-
-        return None
+        return _extract_le_connection_complete(packet_bytes)
 
     @staticmethod
     def LogEventCode():
-        return lambda event: logging.info("Received event: %x" % hci_packets.EventView(bt_packets.PacketViewLittleEndian(list(event.payload))).GetEventCode())
+        return _log_event_code
 
     @staticmethod
     def LinkKeyRequest():
@@ -183,7 +210,7 @@ class HciMatchers(object):
 
     @staticmethod
     def Disconnect():
-        return lambda event: HciMatchers.EventWithCode(EventCode.DISCONNECT)
+        return HciMatchers.EventWithCode(EventCode.DISCONNECTION_COMPLETE)
 
     @staticmethod
     def DisconnectionComplete():
@@ -203,29 +230,32 @@ class HciMatchers(object):
 
     @staticmethod
     def Exactly(packet):
+        # Serialize once up front; the returned predicate only compares bytes and is safe to reuse.
         data = bytes(packet.Serialize())
-        return lambda event: data == event.payload
+        return lambda event, _data=data: _data == event.payload
 
 
 class AdvertisingMatchers(object):
 
     @staticmethod
     def AdvertisingCallbackMsg(type, advertiser_id=None, status=None, data=None):
-        return lambda event: True if event.message_type == type and (advertiser_id == None or advertiser_id == event.advertiser_id) \
-            and (status == None or status == event.status) and (data == None or data == event.data) else False
+        return lambda event: (event.message_type == type and
+                              (advertiser_id is None or advertiser_id == event.advertiser_id) and
+                              (status is None or status == event.status) and (data is None or data == event.data))
 
     @staticmethod
     def AddressMsg(type, advertiser_id=None, address=None):
-        return lambda event: True if event.message_type == type and (advertiser_id == None or advertiser_id == event.advertiser_id) \
-            and (address == None or address == event.address) else False
+        return lambda event: (event.message_type == type and
+                              (advertiser_id is None or advertiser_id == event.advertiser_id) and
+                              (address is None or address == event.address))
 
 
 class ScanningMatchers(object):
 
     @staticmethod
     def ScanningCallbackMsg(type, status=None, data=None):
-        return lambda event: True if event.message_type == type and (status == None or status == event.status) \
-            and (data == None or data == event.data) else False
+        return lambda event: event.message_type == type and (status is None or status == event.status) \
+            and (data is None or data == event.data)
 
 
 class NeighborMatchers(object):
@@ -720,30 +750,31 @@ class L2capMatchers(object):
 
     @staticmethod
     def LinkSecurityInterfaceCallbackEvent(type):
-        return lambda event: True if event.event_type == type else False
+        return lambda event: event.event_type == type
 
 
 class SecurityMatchers(object):
 
     @staticmethod
     def UiMsg(type, address=None):
-        return lambda event: True if event.message_type == type and (address == None or address == event.peer) else False
+        return lambda event: event.message_type == type and (address is None or address == event.peer)
 
     @staticmethod
     def BondMsg(type, address=None, reason=None):
-        return lambda event: True if event.message_type == type and (address == None or address == event.peer) and (reason == None or reason == event.reason) else False
+        return lambda event: (event.message_type == type and (address is None or address == event.peer) and
+                              (reason is None or reason == event.reason))
 
     @staticmethod
     def HelperMsg(type, address=None):
-        return lambda event: True if event.message_type == type and (address == None or address == event.peer) else False
+        return lambda event: event.message_type == type and (address is None or address == event.peer)
 
 
 class IsoMatchers(object):
 
     @staticmethod
     def Data(payload):
-        return lambda packet: packet.payload == payload
+        return lambda packet, _payload=bytes(payload): packet.payload == _payload
 
     @staticmethod
     def PacketPayloadWithMatchingCisHandle(cis_handle):
-        return lambda packet: None if cis_handle != packet.handle else packet
+        return lambda packet, _cis_handle=cis_handle: None if _cis_handle != packet.handle else packet